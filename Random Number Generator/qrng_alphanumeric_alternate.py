@@ -4,10 +4,12 @@ Quantum Alphanumeric String Generator (QASG)
 Generates cryptographically strong, random alphanumeric strings
 using quantum superposition and Qiskit.
 
-Language: Python 3.6+
+Language: Python 3.9+
 Dependencies:
 - Qiskit >= 2.0:    pip install qiskit>=2.0
+- Qiskit-Aer:       pip install qiskit-aer
 - NumPy:            pip install numpy
+- Numba (optional): pip install numba   # JIT decoder for multi-million-shot runs
 Parameters:
 - length (int): Even number specifying the total length of the string.
 - shots (int):  Number of strings to generate (default: 1).
@@ -19,11 +21,10 @@ Features:
 - Memory efficient and suitable for cryptographic or security applications.
 """
 
-from qiskit import QuantumCircuit
-from qiskit.quantum_info import Statevector
-import string
+import numpy as np
+from qrng_sampling import sample_strings
 
-def generate_quantum_alphanumeric(length: int, shots: int = 1):
+def generate_quantum_alphanumeric(length: int, shots: int = 1, workers: int = None):
     """
     Generate random alphanumeric strings using quantum circuits.
     The output alternates between digits and lowercase letters.
@@ -34,51 +35,38 @@ def generate_quantum_alphanumeric(length: int, shots: int = 1):
         Lambai (even honi chahiye taaki digits aur letters alternate ho).
         shots (int): Number of strings to generate (default: 1).
         Kitne strings generate karne hain (default: 1).
+        workers (int): Worker processes to split the shots across, or None for serial (default: None).
+            Ignored below qrng_sampling.MIN_SHOTS_PER_WORKER shots per worker; the calling
+            script needs an `if __name__ == "__main__":` guard.
+        Shots ko kitne worker processes mein baantna hai, None ho to serial (default: None).
+            Har worker ko qrng_sampling.MIN_SHOTS_PER_WORKER se kam shots milein to ignore hota hai;
+            calling script mein `if __name__ == "__main__":` guard zaroori hai.
 
     Returns:
-        str or list: Generated string(s) or None if input is invalid.
-        Banayi gayi string ya list, agar input invalid ho to None.
-    """
-    try:
-        if not isinstance(length, int) or length <= 0:
-            raise ValueError("String length must be a positive integer. Lambai positive integer honi chahiye.")
-        if length % 2 != 0:
-            raise ValueError("String length must be even to alternate digits and letters. Lambai even honi chahiye.")
-
-        digits = string.digits      # '0'-'9'
-        letters = string.ascii_lowercase  # 'a'-'z'
-        digit_qubits = 4    # 2^4 = 16 > 10 (digits)
-        letter_qubits = 5   # 2^5 = 32 > 26 (letters)
-
-        results = []
-        for _ in range(shots):
-            result = ""
-            for i in range(length):
-                is_digit = (i % 2 == 0)
-                n_qubits = digit_qubits if is_digit else letter_qubits
+        str or list: Generated string, or a list of them when shots > 1.
+        Banayi gayi string, ya shots > 1 ho to strings ki list.
 
-                qc = QuantumCircuit(n_qubits)
-                qc.h(range(n_qubits))  # Apply Hadamard to all qubits
-                state = Statevector.from_instruction(qc)
-                sample = list(state.sample_counts(shots=1).keys())[0]
-
-                if is_digit:
-                    idx = int(sample, 2) % 10
-                    result += digits[idx]
-                else:
-                    idx = int(sample, 2) % 26
-                    result += letters[idx]
-            results.append(result)
-        return results[0] if shots == 1 else results
+    Raises:
+        ValueError: If length, shots or workers is invalid.
+        Agar length, shots ya workers invalid ho.
+    """
+    if not isinstance(length, int) or length <= 0:
+        raise ValueError("String length must be a positive integer. Lambai positive integer honi chahiye.")
+    if length % 2 != 0:
+        raise ValueError("String length must be even to alternate digits and letters. Lambai even honi chahiye.")
+    if not isinstance(shots, int) or shots <= 0:
+        raise ValueError("Shots must be a positive integer. Shots positive integer hone chahiye.")
+    if workers is not None and (not isinstance(workers, int) or workers <= 0):
+        raise ValueError("Workers must be a positive integer. Workers positive integer hone chahiye.")
 
-    except Exception as e:
-        print(f"Quantum generation failed: {str(e)}. Quantum banane mein error: {str(e)}")
-        return None
+    # One fused draw covers every character of every string
+    is_digit = np.arange(length) % 2 == 0
+    results = sample_strings(is_digit, shots, workers=workers)
+    return results[0] if shots == 1 else results
 
 if __name__ == "__main__":
     string_length = 6   # Must be even
     num_strings = 1     # How many strings to generate
     quantum_string = generate_quantum_alphanumeric(string_length, shots=num_strings)
-    if quantum_string is not None:
-        print(f"Quantum-generated alphanumeric string ({string_length} chars): {quantum_string}. "
-              f"Quantum se bani alphanumeric string ({string_length} akshar): {quantum_string}")
\ No newline at end of file
+    print(f"Quantum-generated alphanumeric string ({string_length} chars): {quantum_string}. "
+          f"Quantum se bani alphanumeric string ({string_length} akshar): {quantum_string}")
\ No newline at end of file
@@ -2,11 +2,11 @@
 Quantum Random Number Generator (QRNG) for generating random bitstrings using Qiskit 2.x.
 Quantum se random bitstrings banata hai (jaise 10110011).
 
-Language: Python 3.6+
+Language: Python 3.9+
 Dependencies:
 - Qiskit 2.0+: `pip install qiskit>=2.0`
-- Qiskit-Aer: `pip install qiskit-aer>=0.12.0`
-- Matplotlib: `pip install matplotlib>=3.5.0`
+- Qiskit-Aer: `pip install qiskit-aer>=0.17`
+- Matplotlib: `pip install matplotlib>=3.5.0` (only for show_graph)
 Parameters:
 - num_bits: Number of bits in the bitstring (e.g., 8 for '10110011').
 - show_graph: Boolean to display histogram of bitstring distribution (default: False).
@@ -18,16 +18,24 @@ Features:
 - Fixed graph display issue with explicit plt.show().
 - Bilingual Hindi-English comments and output for accessibility.
 """
-%matplotlib inline
-from qiskit import QuantumCircuit
-from qiskit_aer.primitives import Sampler
-from qiskit.visualization import plot_histogram
-import matplotlib.pyplot as plt
+from qiskit import QuantumCircuit, transpile
+from qiskit_aer import AerSimulator
+from qiskit_aer.primitives import SamplerV2
+
+# Same stabilizer backend the alphanumeric generators use (see qrng_sampling.py)
+SAMPLER_OPTIONS = {"backend_options": {"method": "stabilizer"}}
+
+# Transpiled QRNG circuits keyed by qubit count, reused across calls
+_CIRCUIT_CACHE = {}
 
 def create_qrng_circuit(num_qubits: int) -> QuantumCircuit:
     """
     Create a quantum circuit with Hadamard gates for random bitstring generation.
     Hadamard gates ke saath quantum circuit banata hai random bitstring ke liye.
+    The circuit is transpiled for the stabilizer simulator once per qubit count
+    and cached, so treat the result as read-only.
+    Circuit har qubit count ke liye ek baar transpile hokar cache hota hai,
+    isliye result ko badlein nahi.
     
     Args:
         num_qubits (int): Number of qubits (bits) in the circuit.
@@ -37,11 +45,44 @@ def create_qrng_circuit(num_qubits: int) -> QuantumCircuit:
         QuantumCircuit: Circuit with Hadamard gates and measurements.
         Quantum circuit jo Hadamard gates aur measurements ke saath hai.
     """
-    qc = QuantumCircuit(num_qubits)
-    qc.h(range(num_qubits))  # Put qubits into superposition
-    qc.measure_all()  # Measure all qubits
+    qc = _CIRCUIT_CACHE.get(num_qubits)
+    if qc is None:
+        qc = QuantumCircuit(num_qubits)
+        qc.h(range(num_qubits))  # Put qubits into superposition
+        qc.measure_all()  # Measure all qubits
+        # Hadamard + measure needs no optimization, only mapping to the backend
+        qc = transpile(qc, AerSimulator(method="stabilizer"), optimization_level=0)
+        _CIRCUIT_CACHE[num_qubits] = qc
     return qc
 
+def clear_cache() -> None:
+    """
+    Drop all cached QRNG circuits.
+    Saare cached QRNG circuits hata deta hai.
+    """
+    _CIRCUIT_CACHE.clear()
+
+def get_random_bitstrings(qc: QuantumCircuit, n: int) -> list[str]:
+    """
+    Generate `n` independent random bitstrings from a single sampler run.
+    Ek hi sampler run se `n` independent random bitstrings banata hai.
+    
+    Args:
+        qc (QuantumCircuit): Quantum circuit to sample from.
+        Quantum circuit jisse sample karna hai.
+        n (int): Number of bitstrings (shots) to sample.
+        Kitne bitstrings (shots) sample karne hain.
+    
+    Returns:
+        list[str]: `n` sampled bitstrings, one per shot (e.g., ['10110011', ...]).
+        Har shot ka ek sampled bitstring (jaise ['10110011', ...]).
+    """
+    if not isinstance(n, int) or n <= 0:
+        raise ValueError("Number of bitstrings must be a positive integer. Bitstrings ki sankhya positive integer honi chahiye.")
+    sampler = SamplerV2(options=SAMPLER_OPTIONS)
+    result = sampler.run([qc], shots=n).result()
+    return result[0].join_data().get_bitstrings()  # Per-shot memory over all registers, in sampling order
+
 def get_random_bitstring(qc: QuantumCircuit) -> str:
     """
     Generate a random bitstring from the quantum circuit.
@@ -52,15 +93,11 @@ def get_random_bitstring(qc: QuantumCircuit) -> str:
         Quantum circuit jisse sample karna hai.
     
     Returns:
-        str: Random bitstring (e.g., '10110011').
-        Random bitstring (jaise '10110011').
+        str: Random bitstring (e.g., '10110011'), or "" on error.
+        Random bitstring (jaise '10110011'), error par "".
     """
     try:
-        sampler = Sampler()
-        result = sampler.run(qc, shots=1).result()
-        counts = result.quasi_dists[0]
-        bitstring = max(counts, key=counts.get)  # Most probable bitstring
-        return bitstring
+        return get_random_bitstrings(qc, 1)[0]
     except Exception as e:
         print(f"Error: {str(e)}")
         return ""
@@ -77,11 +114,16 @@ def visualize_distribution(qc: QuantumCircuit, shots: int = 1024) -> None:
         Samples ki sankhya distribution ke liye (default: 1024).
     """
     try:
-        sampler = Sampler()
-        result = sampler.run(qc, shots=shots).result()
-        counts = result.quasi_dists[0]
+        # Imported here so plain bitstring generation never pays for matplotlib
+        import matplotlib.pyplot as plt
+        from qiskit.visualization import plot_histogram
+
+        sampler = SamplerV2(options=SAMPLER_OPTIONS)
+        result = sampler.run([qc], shots=shots).result()
+        counts = result[0].join_data().get_counts()
         if counts:
-            plot_histogram(counts)
+            probabilities = {k: v / shots for k, v in counts.items()}  # Counts -> probabilities
+            plot_histogram(probabilities)
             plt.title("Quantum Random Bit Distribution / Quantum Bit Vitaran")
             plt.xlabel("Bitstrings / Bitstrings")
             plt.ylabel("Probability / Sambhavna")
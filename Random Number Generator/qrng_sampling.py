@@ -0,0 +1,218 @@
+"""
+Shared Quantum Sampling Helpers
+-------------------------------
+Sampling and decoding code shared by the alphanumeric generators
+(qrng_alphanumeric_alternate.py and qrng_alphanumeric_pattern.py).
+
+Language: Python 3.9+
+
+Dependencies:
+- Qiskit >= 2.0:    pip install qiskit>=2.0
+- Qiskit-Aer:       pip install qiskit-aer
+- NumPy:            pip install numpy
+- Numba (optional): pip install numba   # JIT decoder for multi-million-shot runs
+
+Features:
+- Samples uniform bits from measured Hadamard circuits on Aer's stabilizer method.
+- Decodes 4-bit / 5-bit fields into digits / lowercase letters through lookup tables.
+- Rejection sampling instead of modulo, so every character is equally likely.
+- Optional splitting of the shots across worker processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import multiprocessing
+from qiskit import QuantumCircuit
+from qiskit_aer import AerSimulator
+import numpy as np
+import secrets
+import string
+
+# Hadamard-only circuits are Clifford, so the stabilizer method samples them
+# from an n x n tableau instead of a 2^n statevector.
+SIMULATOR = AerSimulator(method="stabilizer")
+
+BITS_PER_DIGIT = 4   # 2^4 = 16 > 10 (digits)
+BITS_PER_LETTER = 5  # 2^5 = 32 > 26 (letters)
+
+# Raw 4-bit / 5-bit field value -> ASCII byte; 0 marks values to redraw
+DIGIT_TABLE = string.digits.encode("ascii").ljust(2 ** BITS_PER_DIGIT, b"\0")             # '0'-'9'
+LETTER_TABLE = string.ascii_lowercase.encode("ascii").ljust(2 ** BITS_PER_LETTER, b"\0")  # 'a'-'z'
+
+# A spawned worker re-imports qiskit and qiskit-aer before it samples anything,
+# roughly 0.5-1 s each, while serial sampling does ~120k / 45k / 22k shots/s for
+# 2 / 6 / 12-character strings. Below this many shots per worker the pool is
+# slower than sampling in one process.
+MIN_SHOTS_PER_WORKER = 100_000
+
+@lru_cache(maxsize=32)
+def hadamard_circuit(num_qubits):
+    """
+    Measured n-qubit Hadamard circuit, built once per width and reused.
+
+    Args:
+        num_qubits (int): Number of qubits in the circuit.
+
+    Returns:
+        QuantumCircuit: Cached circuit to sample from (read-only).
+    """
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(range(num_qubits))  # Uniform superposition over all bitstrings
+    circuit.measure_all()
+    return circuit
+
+def sample_bits(num_qubits, shots=1, parallel=False, rng=None):
+    """
+    Sample bits from a fused Hadamard circuit, all shots in a single Aer run.
+
+    Args:
+        num_qubits (int): Total number of qubits (bits) per shot.
+        shots (int): Number of shots to sample (default: 1).
+        parallel (bool): Let Aer parallelize the shots across cores (default: False).
+        rng (np.random.Generator): Source of simulator seeds, or None for Aer's own (default: None).
+
+    Returns:
+        np.ndarray: Array of shape (shots, num_qubits) holding 0/1 values.
+    """
+    # max_parallel_shots=0 lets Aer use every available core
+    run_options = {"max_parallel_shots": 0 if parallel else 1}
+    if rng is not None:
+        run_options["seed_simulator"] = int(rng.integers(2**31))
+    result = SIMULATOR.run(hadamard_circuit(num_qubits), shots=shots, memory=True, **run_options).result()
+    raw = np.frombuffer("".join(result.get_memory()).encode("ascii"), dtype=np.uint8)
+    return raw.reshape(shots, num_qubits) - ord("0")
+
+def field_layout(is_digit):
+    """
+    Bit widths and lookup tables for a sequence of digit / letter fields.
+
+    Args:
+        is_digit (np.ndarray): Boolean per field, True for a digit, False for a letter.
+
+    Returns:
+        tuple: (widths, tables) - bits per field, and a uint8 lookup table per
+        field of shape (len(is_digit), 32) mapping a raw field value to its ASCII byte.
+    """
+    widths = np.where(is_digit, BITS_PER_DIGIT, BITS_PER_LETTER)
+    tables = np.zeros((len(is_digit), len(LETTER_TABLE)), dtype=np.uint8)
+    tables[is_digit, :len(DIGIT_TABLE)] = np.frombuffer(DIGIT_TABLE, dtype=np.uint8)
+    tables[~is_digit] = np.frombuffer(LETTER_TABLE, dtype=np.uint8)
+    return widths, tables
+
+def decode_chars_numpy(bits, widths, tables):
+    """
+    Decode consecutive `width`-bit fields of each row into ASCII bytes via the
+    per-field lookup table; a 0 byte marks a field to redraw.
+    """
+    codes = np.empty((bits.shape[0], len(widths)), dtype=np.uint8)
+    start = 0
+    for j, width in enumerate(widths):
+        weights = 1 << np.arange(width - 1, -1, -1)
+        codes[:, j] = tables[j, bits[:, start:start + width] @ weights]
+        start += width
+    return codes
+
+def decode_chars_loop(bits, widths, tables):
+    """
+    Scalar version of decode_chars_numpy, compiled with numba when available.
+    """
+    shots, n_fields = bits.shape[0], widths.shape[0]
+    codes = np.empty((shots, n_fields), dtype=np.uint8)
+    for s in range(shots):
+        start = 0
+        for j in range(n_fields):
+            value = 0
+            for k in range(start, start + widths[j]):
+                value = (value << 1) | bits[s, k]
+            start += widths[j]
+            codes[s, j] = tables[j, value]
+    return codes
+
+# Importing numba and loading the cached compiled loop costs ~0.4-0.5 s per
+# process, while it decodes only ~0.1 us/row faster than NumPy (6 fields), so
+# the JIT pays back only from a few million rows (an Aer run of ~45 s or more).
+NUMBA_MIN_ROWS = 4_000_000
+
+_decode_chars_jit = None
+
+def decode_chars(bits, widths, tables):
+    """
+    Decode fields with NumPy, or with the numba-compiled loop for NUMBA_MIN_ROWS
+    rows or more when numba is installed (imported on first such call).
+    """
+    global _decode_chars_jit
+    if bits.shape[0] < NUMBA_MIN_ROWS:
+        return decode_chars_numpy(bits, widths, tables)
+    if _decode_chars_jit is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional; the NumPy decoder is used without it
+            _decode_chars_jit = decode_chars_numpy
+        else:
+            _decode_chars_jit = njit(cache=True)(decode_chars_loop)
+    return _decode_chars_jit(bits, widths, tables)
+
+def _sample_chars_chunk(widths, tables, shots, parallel=False, seed=None):
+    """
+    Sample one ASCII character per field for `shots` rows in this process.
+    Field values that map to a 0 byte in the table are redrawn (rejection
+    sampling) instead of being folded with modulo, which would bias the low values.
+
+    Args:
+        widths (np.ndarray): Bits per field.
+        tables (np.ndarray): Lookup table per field, shape (len(widths), 32), uint8.
+        shots (int): Number of rows to sample.
+        parallel (bool): Let Aer parallelize the shots across cores (default: False).
+        seed (int): Seed for the simulator runs of this call, or None (default: None).
+
+    Returns:
+        np.ndarray: uint8 array of shape (shots, len(widths)) with ASCII codes.
+    """
+    rng = None if seed is None else np.random.default_rng(seed)
+    bits = sample_bits(int(widths.sum()), shots, parallel, rng)
+    codes = decode_chars(bits, widths, tables)
+    # Redraw every rejected field of every shot in one run per round: each rejected
+    # field gets one shot of the widest field and keeps its leading `width` bits.
+    rows, cols = np.nonzero(codes == 0)
+    while rows.size:
+        max_width = int(widths[cols].max())
+        redraw_bits = sample_bits(max_width, rows.size, parallel, rng)
+        values = (redraw_bits @ (1 << np.arange(max_width - 1, -1, -1))) >> (max_width - widths[cols])
+        redraw = tables[cols, values]
+        codes[rows, cols] = redraw
+        rows, cols = rows[redraw == 0], cols[redraw == 0]
+    return codes
+
+def sample_strings(is_digit, shots=1, parallel=False, workers=None):
+    """
+    Sample `shots` strings whose characters are digits or letters as given by `is_digit`.
+
+    Args:
+        is_digit (np.ndarray): Boolean per character, True for a digit, False for a letter.
+        shots (int): Number of strings to sample (default: 1).
+        parallel (bool): Let Aer parallelize the shots across cores (default: False).
+        workers (int): Worker processes to split the shots across, or None for serial (default: None).
+            Ignored below MIN_SHOTS_PER_WORKER shots per worker. Workers are spawned, so the
+            calling script needs an `if __name__ == "__main__":` guard.
+
+    Returns:
+        list: `shots` sampled strings.
+    """
+    widths, tables = field_layout(is_digit)
+    if workers is not None and workers > 1 and shots >= MIN_SHOTS_PER_WORKER * workers:
+        # Each worker samples its share of the shots; seeds come from `secrets`
+        # so workers never replay the same simulator stream. Workers are spawned,
+        # not forked: forking after Aer has started its OpenMP threads can deadlock.
+        sizes = [len(chunk) for chunk in np.array_split(np.arange(shots), workers)]
+        seeds = [secrets.randbits(64) for _ in sizes]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as ex:
+            parts = ex.map(_sample_chars_chunk, [widths] * workers, [tables] * workers,
+                           sizes, [parallel] * workers, seeds)
+            codes = np.vstack(list(parts))
+    else:
+        codes = _sample_chars_chunk(widths, tables, shots, parallel)
+
+    # Decode all strings in one pass, then split into fixed-width strings
+    length = len(is_digit)
+    text = codes.tobytes().decode("ascii")
+    return [text[i:i + length] for i in range(0, len(text), length)]
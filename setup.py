@@ -0,0 +1,31 @@
+from setuptools import setup
+
+setup(
+    name="qrng_bitstring",
+    version="1.0.0",
+    description="Quantum Random Number Generator using Qiskit",
+    author="Your Name",
+    # The scripts are top-level modules living in "Random Number Generator/"
+    package_dir={"": "Random Number Generator"},
+    py_modules=[
+        "qrng_bitstring",
+        "qrng_alphanumeric_alternate",
+        "qrng_alphanumeric_pattern",
+        "qrng_sampling"
+    ],
+    python_requires=">=3.9",
+    install_requires=[
+        "qiskit>=2.0,<3",
+        "qiskit-aer>=0.17",
+        "numpy"
+    ],
+    extras_require={
+        "viz": ["matplotlib>=3.5.0"],
+        "jit": ["numba"]
+    },
+    entry_points={
+        "console_scripts": [
+            "qrng-bitstring=qrng_bitstring:run_qrng"
+        ]
+    }
+)
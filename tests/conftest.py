@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules live in "Random Number Generator/" rather than an importable package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Random Number Generator"))
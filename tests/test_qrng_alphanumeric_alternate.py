@@ -0,0 +1,29 @@
+import pytest
+
+from qrng_alphanumeric_alternate import generate_quantum_alphanumeric
+
+
+@pytest.mark.parametrize("length", [0, -2, 3, 2.0, "6"])
+def test_rejects_invalid_length(length):
+    with pytest.raises(ValueError):
+        generate_quantum_alphanumeric(length)
+
+
+@pytest.mark.parametrize("shots", [0, -1, 1.5])
+def test_rejects_invalid_shots(shots):
+    with pytest.raises(ValueError):
+        generate_quantum_alphanumeric(4, shots=shots)
+
+
+@pytest.mark.parametrize("workers", [0, -1, 2.0])
+def test_rejects_invalid_workers(workers):
+    with pytest.raises(ValueError):
+        generate_quantum_alphanumeric(4, workers=workers)
+
+
+def test_alternates_digits_and_letters():
+    strings = generate_quantum_alphanumeric(6, shots=20)
+    assert len(strings) == 20
+    for s in strings:
+        assert len(s) == 6
+        assert all(c.isdigit() == (i % 2 == 0) for i, c in enumerate(s))
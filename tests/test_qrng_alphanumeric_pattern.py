@@ -0,0 +1,50 @@
+import pytest
+
+from qrng_alphanumeric_pattern import calculate_entropy, generate_quantum_alphanumeric_string
+
+
+def test_entropy_of_empty_input_is_zero():
+    assert calculate_entropy([]) == 0.0
+    assert calculate_entropy(["", ""]) == 0.0
+
+
+def test_entropy_of_repeated_character_is_zero():
+    assert calculate_entropy(["aaaa"]) == 0.0
+
+
+def test_entropy_counts_non_ascii_characters():
+    # 'é' stands in for 'e', so the distribution (and entropy) matches 'hello'
+    assert calculate_entropy(["héllo"]) == pytest.approx(calculate_entropy(["hello"]))
+    assert calculate_entropy(["日本"]) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("pattern", ["", "   ", "DXL", None, 12])
+def test_rejects_invalid_pattern(pattern):
+    with pytest.raises(ValueError):
+        generate_quantum_alphanumeric_string(pattern)
+
+
+@pytest.mark.parametrize("shots", [0, -1, 1.5])
+def test_rejects_invalid_shots(shots):
+    with pytest.raises(ValueError):
+        generate_quantum_alphanumeric_string("DL", shots=shots)
+
+
+def test_rejects_non_bool_parallel():
+    with pytest.raises(ValueError):
+        generate_quantum_alphanumeric_string("DL", parallel=1)
+
+
+@pytest.mark.parametrize("workers", [0, -1, 2.0])
+def test_rejects_invalid_workers(workers):
+    with pytest.raises(ValueError):
+        generate_quantum_alphanumeric_string("DL", workers=workers)
+
+
+def test_lower_case_pattern_is_normalized():
+    strings, _ = generate_quantum_alphanumeric_string("ddl", shots=20)
+    assert len(strings) == 20
+    for s in strings:
+        assert len(s) == 3
+        assert s[0].isdigit() and s[1].isdigit()
+        assert s[2].isalpha() and s[2].islower()
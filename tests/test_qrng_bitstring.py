@@ -0,0 +1,44 @@
+import pytest
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+import qrng_bitstring
+
+
+def test_get_random_bitstrings_returns_n_strings_of_circuit_width():
+    qc = qrng_bitstring.create_qrng_circuit(6)
+    bitstrings = qrng_bitstring.get_random_bitstrings(qc, 50)
+    assert len(bitstrings) == 50
+    for bits in bitstrings:
+        assert len(bits) == 6
+        assert set(bits) <= {"0", "1"}
+
+
+@pytest.mark.parametrize("n", [0, -1, 1.5])
+def test_get_random_bitstrings_rejects_invalid_n(n):
+    qc = qrng_bitstring.create_qrng_circuit(4)
+    with pytest.raises(ValueError):
+        qrng_bitstring.get_random_bitstrings(qc, n)
+
+
+def test_get_random_bitstrings_reads_named_register():
+    qc = QuantumCircuit(QuantumRegister(3), ClassicalRegister(3, "out"))
+    qc.h(range(3))
+    qc.measure(range(3), range(3))
+    bitstrings = qrng_bitstring.get_random_bitstrings(qc, 20)
+    assert len(bitstrings) == 20
+    assert all(len(bits) == 3 for bits in bitstrings)
+
+
+def test_create_qrng_circuit_is_cached_per_width():
+    qrng_bitstring.clear_cache()
+    qc = qrng_bitstring.create_qrng_circuit(5)
+    assert qrng_bitstring.create_qrng_circuit(5) is qc
+    assert qrng_bitstring.create_qrng_circuit(6) is not qc
+
+
+def test_clear_cache_forces_rebuild():
+    qc = qrng_bitstring.create_qrng_circuit(5)
+    qrng_bitstring.clear_cache()
+    rebuilt = qrng_bitstring.create_qrng_circuit(5)
+    assert rebuilt is not qc
+    assert rebuilt.num_qubits == qc.num_qubits
@@ -0,0 +1,49 @@
+import string
+
+import numpy as np
+
+import qrng_sampling
+
+ALPHABET = set((string.digits + string.ascii_lowercase).encode("ascii"))
+
+
+def _layout_and_bits(n_fields=7, shots=2000, seed=1234):
+    rng = np.random.default_rng(seed)
+    is_digit = rng.random(n_fields) < 0.5
+    widths, tables = qrng_sampling.field_layout(is_digit)
+    bits = rng.integers(0, 2, size=(shots, int(widths.sum())), dtype=np.uint8)
+    return is_digit, widths, tables, bits
+
+
+def test_decoders_agree():
+    _, widths, tables, bits = _layout_and_bits()
+    expected = qrng_sampling.decode_chars_numpy(bits, widths, tables)
+    np.testing.assert_array_equal(qrng_sampling.decode_chars_loop(bits, widths, tables), expected)
+    np.testing.assert_array_equal(qrng_sampling.decode_chars(bits, widths, tables), expected)
+    try:
+        from numba import njit
+    except ImportError:
+        return
+    np.testing.assert_array_equal(njit(qrng_sampling.decode_chars_loop)(bits, widths, tables), expected)
+
+
+def test_decoder_marks_out_of_range_values():
+    is_digit, widths, tables, bits = _layout_and_bits()
+    codes = qrng_sampling.decode_chars_numpy(bits, widths, tables)
+    start = 0
+    for j, width in enumerate(widths):
+        values = bits[:, start:start + width] @ (1 << np.arange(width - 1, -1, -1))
+        limit = 10 if is_digit[j] else 26
+        assert np.all((codes[:, j] == 0) == (values >= limit))
+        start += width
+
+
+def test_sample_strings_never_contain_rejected_values():
+    is_digit = np.array([True, False, False, True, False])
+    strings = qrng_sampling.sample_strings(is_digit, shots=500)
+    assert len(strings) == 500
+    for s in strings:
+        assert len(s) == len(is_digit)
+        assert set(s.encode("ascii")) <= ALPHABET
+        for c, digit in zip(s, is_digit):
+            assert c.isdigit() == digit